@@ -19,9 +19,14 @@ if TYPE_CHECKING:
     # Make the symbol visible to static type checkers without importing at runtime
     from .app import AegisApp  # noqa: F401
 
-try:
-    __version__ = _version("appdaemon-aegis")
-except PackageNotFoundError:
-    __version__ = "0.0.0"
+
+def _detect_version() -> str:
+    try:
+        return _version("appdaemon-aegis")
+    except PackageNotFoundError:
+        return "0.0.0"
+
+
+__version__ = _detect_version()
 
 __all__ = ("AegisApp", "__version__")
@@ -25,14 +25,6 @@ def test_dir():
 
 
 def test_version_not_found():
-    """Test that __version__ is '0.0.0' when package is not found."""
-    try:
-        with patch(
-            "importlib.metadata.version", side_effect=importlib.metadata.PackageNotFoundError
-        ):
-            # We need to reload the module to trigger the version check again
-            importlib.reload(appdaemon_aegis)
-        assert appdaemon_aegis.__version__ == "0.0.0"
-    finally:
-        # Reload again to restore the original version
-        importlib.reload(appdaemon_aegis)
+    """Test that the version falls back to '0.0.0' when package is not found."""
+    with patch("appdaemon_aegis._version", side_effect=importlib.metadata.PackageNotFoundError):
+        assert appdaemon_aegis._detect_version() == "0.0.0"